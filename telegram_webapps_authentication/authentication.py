@@ -1,12 +1,42 @@
 import base64
+import binascii
 import hashlib
 import hmac
 import json
+import re
 import time
-from typing import Any, Dict
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import unquote
 from pydantic import BaseModel
-from urllib.parse import parse_qs
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_TRANS_36 = bytes(x ^ 0x36 for x in range(256))
+_TRANS_5C = bytes(x ^ 0x5C for x in range(256))
+_PERCENT_RUN = re.compile(rb'(?:%[0-9A-Fa-f]{2})+')
+
+
+def _decode_percent_run(match: re.Match) -> bytes:
+    return binascii.unhexlify(match.group().replace(b'%', b''))
+
+
+def _unquote_plus_to_bytes(value: str) -> bytes:
+    """
+    Percent-decodes a query string value into bytes, treating '+' as a space.
+
+    Equivalent to `unquote_to_bytes(value.replace('+', ' '))`, but decodes each run of
+    consecutive escapes with a single `unhexlify` call instead of one lookup per escape.
+    """
+    if '%' not in value:
+        return value.replace('+', ' ').encode()
+    return _PERCENT_RUN.sub(_decode_percent_run, value.replace('+', ' ').encode())
+
 
 class TelegramUser(BaseModel):
     """
@@ -32,18 +62,54 @@ class Authenticator:
     """
     Handles authentication and validation of initial data from Telegram.
     """
-    REQUIRED_KEYS: set = {'query_id', 'user', 'auth_date', 'hash'}
+    REQUIRED_KEYS: frozenset = frozenset({'query_id', 'user', 'auth_date', 'hash'})
     USER_DATA_KEYS: list = ['id', 'username', 'first_name', 'last_name', 'language_code']
+    _SORTED_NON_HASH_KEYS: list = ['auth_date', 'query_id', 'user']
+    CACHE_SIZE: int = 1024
 
-    def __init__(self, bot_token: str):
+    def __init__(self, bot_token: str, strict: bool = False):
         """
         Initializes the Authenticator with a bot token.
 
         Args:
             bot_token (str): Token for the Telegram bot.
+            strict (bool): Run full pydantic validation when building `TelegramUser`
+                and `InitialData`. By default the models are constructed from the
+                already checked data without re-validation.
         """
         self.bot_token = bot_token
+        self.strict = strict
+        self._max_age_seconds = 300
         self.secret_key = hmac.new("WebAppData".encode(), bot_token.encode(), hashlib.sha256).digest()
+        self._init_runtime_state()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # hashlib objects cannot be pickled; they are rebuilt from `secret_key`.
+        state = self.__dict__.copy()
+        for name in ('_inner_proto', '_outer_proto', '_cache'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_runtime_state()
+
+    def _init_runtime_state(self) -> None:
+        """
+        Builds the precomputed HMAC states and the validation cache from `secret_key`.
+        """
+        # The HMAC key never changes, so hash the padded key blocks once and
+        # clone the resulting states for every validation.
+        key_block = self.secret_key.ljust(64, b'\x00')
+        self._inner_proto = hashlib.sha256(key_block.translate(_TRANS_36))
+        self._outer_proto = hashlib.sha256(key_block.translate(_TRANS_5C))
+
+        # FastAPI dependencies and route bodies tend to validate the same
+        # init_data several times per request. Only data with a matching hash
+        # is cached, so junk input cannot evict real entries. The cached result
+        # does not depend on the clock, so `check_time` is still applied on
+        # every call. The cached dicts are shared and must not be mutated.
+        self._cache = OrderedDict()
 
     def initial_data_parse(self, init_data: str) -> Dict[str, Any]:
         """
@@ -60,23 +126,61 @@ class Authenticator:
         """
         parsed_data = {}
         for item in init_data.split('&'):
-            if '=' in item:
-                key, value = item.split('=', 1)
-                if key in self.REQUIRED_KEYS:
-                    parsed_data[key] = unquote(value)
+            key, sep, value = item.partition('=')
+            if sep and key in self.REQUIRED_KEYS:
+                parsed_data[key] = unquote(value)
 
-        missing_keys = self.REQUIRED_KEYS - parsed_data.keys()
-        if missing_keys:
+        if len(parsed_data) != len(self.REQUIRED_KEYS):
+            missing_keys = self.REQUIRED_KEYS - parsed_data.keys()
             raise ValueError(f"Missing required keys: {', '.join(missing_keys)}")
 
         return parsed_data
 
-    def extract_user_data(self, init_data: str) -> Dict[str, str]:
+    def initial_data_prepare(self, init_data_dict: Dict[str, Any]) -> str:
+        """
+        Prepares the cleaned data string by excluding the 'hash' key and sorting the remaining key-value pairs.
+
+        The order of the keys kept by `initial_data_parse` is fixed in `_SORTED_NON_HASH_KEYS`,
+        so a dict holding only those keys is not sorted per call. Any other keys are merged in
+        sorted order.
+
+        Args:
+            init_data_dict (Dict[str, Any]): Dictionary of initial data.
+
+        Returns:
+            str: Prepared data string.
+
+        Raises:
+            ValueError: If `init_data_dict` is empty or if no data is available after excluding the 'hash' key.
+            TypeError: If any value is not a string.
+        """
+        if not init_data_dict:
+            raise ValueError("init_data_dict is empty")
+
+        keys = [key for key in self._SORTED_NON_HASH_KEYS if key in init_data_dict]
+        if len(keys) + ('hash' in init_data_dict) != len(init_data_dict):
+            keys = sorted(key for key in init_data_dict if key != 'hash')
+
+        lines = []
+        for key in keys:
+            value = init_data_dict[key]
+            if not isinstance(value, str):
+                raise TypeError(f"Value for key '{key}' is not a string")
+            lines.append(f"{key}={value}")
+
+        if not lines:
+            raise ValueError("No data available after excluding 'hash'")
+
+        return "\n".join(lines)
+
+    def extract_user_data(self, init_data: str, init_data_dict: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         """
         Extracts user-specific data from the initial data.
 
         Args:
             init_data (str): Initial data in query string format.
+            init_data_dict (Optional[Dict[str, Any]]): Already parsed initial data. When given,
+                `init_data` is not parsed again.
 
         Returns:
             Dict[str, str]: Extracted user data.
@@ -84,14 +188,30 @@ class Authenticator:
         Raises:
             ValueError: If 'user' key is missing in initial data or if user data is not valid JSON.
         """
-        init_data_dict = self.initial_data_parse(init_data)
+        if init_data_dict is None:
+            init_data_dict = self.initial_data_parse(init_data)
+
+        return self._extract_user_fields(init_data_dict)
+
+    def _extract_user_fields(self, init_data_dict: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Extracts user-specific data from already parsed initial data.
+
+        Args:
+            init_data_dict (Dict[str, Any]): Parsed initial data.
 
+        Returns:
+            Dict[str, str]: Extracted user data.
+
+        Raises:
+            ValueError: If 'user' key is missing in initial data or if user data is not valid JSON.
+        """
         if 'user' not in init_data_dict:
             raise ValueError("Missing 'user' key in initial data")
 
         try:
-            user_data = json.loads(init_data_dict['user'])
-        except json.JSONDecodeError:
+            user_data = _json_loads(init_data_dict['user'])
+        except (json.JSONDecodeError, UnicodeDecodeError):
             raise ValueError("User data is not valid JSON")
 
         extracted_data = {k: user_data.get(k, '') for k in self.USER_DATA_KEYS}
@@ -115,30 +235,144 @@ class Authenticator:
         Raises:
             ValueError: If 'hash' key is not found in `init_data`.
         """
-        parsed_data = {key: unquote(value[0]) for key, value in parse_qs(init_data).items()}
-
-        received_hash = parsed_data.pop('hash', None)
-        auth_date = int(parsed_data.get('auth_date', 0))
-
-        if not received_hash or not auth_date:
+        is_valid, parsed_data = self._check_init_data(init_data)
+        if not is_valid:
             return False
-        
-        current_time = int(time.time())
 
         # Hash timed out․
         if check_time:
-            if current_time - auth_date > 300 :  
+            if self._is_expired(parsed_data['auth_date'], int(time.time())):
                 return False
-        
-        data_check_string = "\n".join(f"{key}={value}" for key, value in sorted(parsed_data.items()))
 
-        computed_hash = hmac.new(
-            key=self.secret_key,
-            msg=data_check_string.encode(),
-            digestmod=hashlib.sha256
-        ).hexdigest()
+        return True
+
+    def validate_many(self, init_datas: List[str], check_time = False) -> List[bool]:
+        """
+        Validates several initial data strings at once.
+
+        The results are not cached: batch inputs are rarely validated again, and they
+        would evict the entries reused by `get_telegram_user` and `get_initial_data`.
+
+        Args:
+            init_datas (List[str]): Initial data strings in query string format.
+            check_time (bool): Reject data whose `auth_date` is more than five minutes old.
+                The clock is read once for the whole batch.
+
+        Returns:
+            List[bool]: For each input, True if the data is valid, False otherwise.
+        """
+        check = self._compute_init_data
+        current_time = int(time.time()) if check_time else 0
+
+        results = []
+        for init_data in init_datas:
+            is_valid, parsed_data = check(init_data)
+            # Hash timed out․
+            if is_valid and check_time and self._is_expired(parsed_data['auth_date'], current_time):
+                is_valid = False
+            results.append(is_valid)
+
+        return results
 
-        return computed_hash == received_hash
+    def _is_expired(self, auth_date: bytes, current_time: int) -> bool:
+        """
+        Checks whether `auth_date` is older than the allowed age.
+
+        Args:
+            auth_date (bytes): Raw `auth_date` value from the initial data.
+            current_time (int): Current Unix time.
+
+        Returns:
+            bool: True if the data timed out or `auth_date` is not a number.
+        """
+        try:
+            return current_time - int(auth_date) > self._max_age_seconds
+        except ValueError:
+            return True
+
+    def _check_init_data(self, init_data: str) -> Tuple[bool, Dict[str, bytes]]:
+        """
+        Parses the initial data and checks its hash, reusing earlier results for valid data.
+
+        Args:
+            init_data (str): Initial data in query string format.
+
+        Returns:
+            Tuple[bool, Dict[str, bytes]]: Whether the hash matches, and the parsed data.
+        """
+        if not init_data or not isinstance(init_data, str):
+            return False, {}
+
+        cache = self._cache
+        parsed_data = cache.get(init_data)
+        if parsed_data is not None:
+            try:
+                cache.move_to_end(init_data)
+            except KeyError:
+                pass
+            return True, parsed_data
+
+        is_valid, parsed_data = self._compute_init_data(init_data)
+        if is_valid:
+            cache[init_data] = parsed_data
+            if len(cache) > self.CACHE_SIZE:
+                try:
+                    cache.popitem(last=False)
+                except KeyError:
+                    pass
+
+        return is_valid, parsed_data
+
+    def _compute_init_data(self, init_data: str) -> Tuple[bool, Dict[str, bytes]]:
+        """
+        Parses the initial data and checks its hash, without any caching.
+
+        Args:
+            init_data (str): Initial data in query string format.
+
+        Returns:
+            Tuple[bool, Dict[str, bytes]]: Whether the hash matches, and the parsed data
+            with URL-decoded but still UTF-8 encoded values.
+        """
+        if not init_data or not isinstance(init_data, str):
+            return False, {}
+
+        pairs = []
+        append = pairs.append
+        decode = _unquote_plus_to_bytes
+        received_hash = None
+        for item in init_data.split('&'):
+            key, sep, value = item.partition('=')
+            if not sep:
+                continue
+            value = decode(value)
+            if key == 'hash':
+                received_hash = value
+                continue
+            append((key, value))
+
+        parsed_data = dict(pairs)
+        auth_date = parsed_data.get('auth_date')
+        # A SHA-256 hex digest is always 64 hex characters and auth_date must
+        # be present; reject anything else before doing the sort and HMAC work.
+        if received_hash is None or len(received_hash) != 64 or not auth_date:
+            return False, parsed_data
+        parsed_data['hash'] = received_hash
+
+        try:
+            received_bytes = binascii.unhexlify(received_hash)
+        except ValueError:
+            return False, parsed_data
+
+        pairs.sort(key=itemgetter(0))
+        data_check_string = b"\n".join(key.encode() + b"=" + value for key, value in pairs)
+
+        inner = self._inner_proto.copy()
+        inner.update(data_check_string)
+        outer = self._outer_proto.copy()
+        outer.update(inner.digest())
+
+        return hmac.compare_digest(outer.digest(), received_bytes), parsed_data
 
     def get_telegram_user(self, init_data: str) -> TelegramUser:
         """
@@ -153,12 +387,11 @@ class Authenticator:
         Raises:
             ValueError: If `init_data` is not valid.
         """
-        if not self.validate_init_data(init_data):
+        is_valid, init_data_dict = self._check_init_data(init_data)
+        if not is_valid:
             raise ValueError("init_data is not valid")
 
-        user_data = self.extract_user_data(init_data)
-
-        return TelegramUser(**user_data)
+        return self._build_telegram_user(init_data_dict)
 
     def get_initial_data(self, init_data: str) -> InitialData:
         """
@@ -173,13 +406,40 @@ class Authenticator:
         Raises:
             ValueError: If `init_data` is not valid.
         """
-        if not self.validate_init_data(init_data):
+        is_valid, init_data_dict = self._check_init_data(init_data)
+        if not is_valid:
             raise ValueError("init_data is not valid")
 
-        init_data_dict = self.initial_data_parse(init_data)
+        user = self._build_telegram_user(init_data_dict)
+        query_id = init_data_dict['query_id'].decode()
+        auth_date = init_data_dict['auth_date'].decode()
+        received_hash = init_data_dict['hash'].decode()
+        if self.strict:
+            return InitialData(query_id=query_id, user=user, auth_date=auth_date, hash=received_hash)
+        return InitialData.model_construct(query_id=query_id, user=user, auth_date=auth_date, hash=received_hash)
 
-        user = self.get_telegram_user(init_data)
-        return InitialData(query_id=init_data_dict['query_id'], user=user, auth_date=init_data_dict['auth_date'], hash=init_data_dict['hash'])
+    def _build_telegram_user(self, init_data_dict: Dict[str, Any]) -> TelegramUser:
+        """
+        Builds a `TelegramUser` from already validated initial data.
+
+        Args:
+            init_data_dict (Dict[str, Any]): Parsed initial data.
+
+        Returns:
+            TelegramUser: Extracted Telegram user information.
+
+        Raises:
+            ValueError: If any required keys are missing in the data.
+        """
+        missing_keys = self.REQUIRED_KEYS - init_data_dict.keys()
+        if missing_keys:
+            raise ValueError(f"Missing required keys: {', '.join(missing_keys)}")
+
+        user_data = self._extract_user_fields(init_data_dict)
+
+        if self.strict:
+            return TelegramUser(**user_data)
+        return TelegramUser.model_construct(**user_data)
 
     def encode_init_data(self, data: str) -> str:
         """
@@ -191,7 +451,7 @@ class Authenticator:
         Returns:
             str: Base64 encoded data.
         """
-        return base64.b64encode(data.encode()).decode()
+        return self.encode_init_data_bytes(data.encode()).decode()
 
     def decode_init_data(self, encoded_data: str) -> str:
         """
@@ -203,4 +463,28 @@ class Authenticator:
         Returns:
             str: Decoded data.
         """
-        return base64.b64decode(encoded_data.encode()).decode()
\ No newline at end of file
+        return self.decode_init_data_bytes(encoded_data.encode()).decode()
+
+    def encode_init_data_bytes(self, data: bytes) -> bytes:
+        """
+        Encodes initial data to base64 format without converting to `str`.
+
+        Args:
+            data (bytes): Data to be encoded.
+
+        Returns:
+            bytes: Base64 encoded data.
+        """
+        return base64.b64encode(data)
+
+    def decode_init_data_bytes(self, encoded_data: bytes) -> bytes:
+        """
+        Decodes initial data from base64 format without converting to `str`.
+
+        Args:
+            encoded_data (bytes): Base64 encoded data.
+
+        Returns:
+            bytes: Decoded data.
+        """
+        return base64.b64decode(encoded_data)
@@ -0,0 +1,204 @@
+import copy
+import hashlib
+import hmac
+import json
+import pickle
+import random
+import time
+import unittest
+from urllib.parse import quote, unquote_to_bytes
+
+from telegram_webapps_authentication import Authenticator
+from telegram_webapps_authentication.authentication import _unquote_plus_to_bytes
+
+BOT_TOKEN = "123456:TEST-TOKEN"
+
+
+def make_init_data(fields: dict, bot_token: str = BOT_TOKEN) -> str:
+    """
+    Builds init_data signed the same way Telegram signs it.
+    """
+    secret_key = hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
+    data_check_string = "\n".join(f"{key}={value}" for key, value in sorted(fields.items()))
+    received_hash = hmac.new(secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
+    items = list(fields.items()) + [("hash", received_hash)]
+    return "&".join(f"{key}={quote(value, safe='')}" for key, value in items)
+
+
+def make_fields(auth_date: int) -> dict:
+    user = {"id": 42, "first_name": "Ivan", "last_name": "Petrov", "username": "ivan", "language_code": "en"}
+    return {"query_id": "AAH", "user": json.dumps(user), "auth_date": str(auth_date)}
+
+
+class ValidationCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.authenticator = Authenticator(BOT_TOKEN)
+
+    def test_check_time_applied_on_cache_hit(self):
+        init_data = make_init_data(make_fields(int(time.time()) - 1000))
+
+        self.assertTrue(self.authenticator.validate_init_data(init_data))
+        self.assertIn(init_data, self.authenticator._cache)
+
+        self.assertFalse(self.authenticator.validate_init_data(init_data, check_time=True))
+        self.assertTrue(self.authenticator.validate_init_data(init_data))
+
+    def test_invalid_data_not_cached(self):
+        init_data = make_init_data(make_fields(int(time.time())), bot_token="654321:OTHER")
+
+        self.assertFalse(self.authenticator.validate_init_data(init_data))
+        self.assertNotIn(init_data, self.authenticator._cache)
+
+
+class ValidateInitDataTest(unittest.TestCase):
+    def setUp(self):
+        self.authenticator = Authenticator(BOT_TOKEN)
+
+    def test_missing_init_data_is_invalid(self):
+        self.assertFalse(self.authenticator.validate_init_data(None))
+        self.assertFalse(self.authenticator.validate_init_data(""))
+        with self.assertRaises(ValueError):
+            self.authenticator.get_telegram_user(None)
+
+    def test_malformed_auth_date_is_invalid(self):
+        self.assertFalse(self.authenticator.validate_init_data("auth_date=&hash=" + "a" * 64))
+        self.assertFalse(self.authenticator.validate_init_data("auth_date=abc&hash=" + "a" * 64))
+        self.assertFalse(self.authenticator.validate_init_data("auth_date=" + "9" * 5000 + "&hash=" + "a" * 64))
+
+    def test_check_time_rejects_non_numeric_auth_date(self):
+        fields = make_fields(int(time.time()))
+        fields["auth_date"] = "abc"
+        init_data = make_init_data(fields)
+
+        self.assertTrue(self.authenticator.validate_init_data(init_data))
+        self.assertFalse(self.authenticator.validate_init_data(init_data, check_time=True))
+
+
+
+    def test_validate_many(self):
+        now = int(time.time())
+        valid = make_init_data(make_fields(now))
+        tampered = make_init_data(make_fields(now), bot_token="654321:OTHER")
+        stale = make_init_data(make_fields(now - 1000))
+        malformed = "auth_date=&hash=" + "a" * 64
+        init_datas = [valid, tampered, stale, malformed, None]
+
+        self.assertEqual(self.authenticator.validate_many(init_datas), [True, False, True, False, False])
+        self.assertEqual(
+            self.authenticator.validate_many(init_datas, check_time=True),
+            [True, False, False, False, False],
+        )
+        self.assertEqual(len(self.authenticator._cache), 0)
+
+
+class MalformedInputTest(unittest.TestCase):
+    def setUp(self):
+        self.authenticator = Authenticator(BOT_TOKEN)
+        # Any HMAC work on the inputs below would fail on these.
+        self.authenticator._inner_proto = None
+        self.authenticator._outer_proto = None
+        self.fields = make_fields(int(time.time()))
+        self.init_data = make_init_data(self.fields)
+        self.prefix, _, self.received_hash = self.init_data.rpartition("&hash=")
+
+    def assertRejected(self, init_data):
+        self.assertFalse(self.authenticator._compute_init_data(init_data)[0])
+        self.assertFalse(self.authenticator.validate_init_data(init_data))
+
+    def test_missing_hash(self):
+        self.assertRejected(self.prefix)
+
+    def test_short_hash(self):
+        self.assertRejected(self.prefix + "&hash=" + self.received_hash[:63])
+
+    def test_non_hex_hash(self):
+        self.assertRejected(self.prefix + "&hash=" + "z" * 64)
+
+    def test_bad_auth_date(self):
+        fields = dict(self.fields, auth_date="")
+        self.assertRejected(make_init_data(fields))
+        self.assertRejected(self.init_data.replace("auth_date=", "auth_dat="))
+
+
+class InitialDataPrepareTest(unittest.TestCase):
+    def setUp(self):
+        self.authenticator = Authenticator(BOT_TOKEN)
+        self.fields = make_fields(int(time.time()))
+
+    def test_matches_signed_string(self):
+        init_data = make_init_data(self.fields)
+        init_data_dict = self.authenticator.initial_data_parse(init_data)
+
+        data_check_string = self.authenticator.initial_data_prepare(init_data_dict)
+
+        expected = "\n".join(f"{key}={value}" for key, value in sorted(self.fields.items()))
+        self.assertEqual(data_check_string, expected)
+        computed_hash = hmac.new(self.authenticator.secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
+        self.assertEqual(computed_hash, init_data_dict["hash"])
+
+    def test_extra_keys_are_sorted_in(self):
+        fields = dict(self.fields, chat_type="sender", chat_instance="-123")
+
+        data_check_string = self.authenticator.initial_data_prepare(dict(fields, hash="h"))
+
+        self.assertEqual(data_check_string, "\n".join(f"{key}={value}" for key, value in sorted(fields.items())))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.authenticator.initial_data_prepare({})
+        with self.assertRaises(ValueError):
+            self.authenticator.initial_data_prepare({"hash": "h"})
+        with self.assertRaises(TypeError):
+            self.authenticator.initial_data_prepare(dict(self.fields, auth_date=1))
+
+
+class UnquoteTest(unittest.TestCase):
+    def assertMatchesStdlib(self, value):
+        self.assertEqual(_unquote_plus_to_bytes(value), unquote_to_bytes(value.replace('+', ' ')), value)
+
+    def test_known_values(self):
+        values = [
+            "", "plain", "a+b", "%", "%4", "%zz", "%%41", "a%4", "%4g1",
+            "%c3%A9", "%7B%22a%22%3A1%7D", "%2B+%20", "Петров", "Пет%D1%80ов",
+        ]
+        for value in values:
+            self.assertMatchesStdlib(value)
+
+    def test_random_values(self):
+        rng = random.Random(0)
+        alphabet = "%%%+ab9FfGzé"
+        for _ in range(20000):
+            self.assertMatchesStdlib("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10))))
+
+
+class StrictModeTest(unittest.TestCase):
+    def test_strict_and_default_build_equal_models(self):
+        init_data = make_init_data(make_fields(int(time.time())))
+        default = Authenticator(BOT_TOKEN)
+        strict = Authenticator(BOT_TOKEN, strict=True)
+
+        self.assertEqual(strict.get_telegram_user(init_data).model_dump(), default.get_telegram_user(init_data).model_dump())
+        self.assertEqual(strict.get_initial_data(init_data).model_dump(), default.get_initial_data(init_data).model_dump())
+
+    def test_strict_rejects_wrongly_typed_user(self):
+        fields = make_fields(int(time.time()))
+        user = dict(json.loads(fields["user"]), id="abc")
+        init_data = make_init_data(dict(fields, user=json.dumps(user)))
+
+        with self.assertRaises(ValueError):
+            Authenticator(BOT_TOKEN, strict=True).get_telegram_user(init_data)
+
+
+class PicklingTest(unittest.TestCase):
+    def test_copies_still_validate(self):
+        authenticator = Authenticator(BOT_TOKEN)
+        init_data = make_init_data(make_fields(int(time.time())))
+        authenticator.validate_init_data(init_data)
+
+        for clone in (copy.deepcopy(authenticator), pickle.loads(pickle.dumps(authenticator))):
+            self.assertTrue(clone.validate_init_data(init_data))
+            self.assertFalse(clone.validate_init_data(init_data[:-1]))
+
+
+if __name__ == '__main__':
+    unittest.main()